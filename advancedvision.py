@@ -1,20 +1,57 @@
+import queue
+import threading
+
 import cv2
 
-def start_camera():
-    """Capture video from the webcam and detect objects."""
-    cap = cv2.VideoCapture(0)
+def open_camera(index=0):
+    """Open the camera, requesting hardware-accelerated decode where supported (best effort)."""
+    if not hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+        return cv2.VideoCapture(index)
 
-    while True:
+    # Hardware acceleration is an open-time property; set() on an open capture is ignored
+    cap = cv2.VideoCapture(index, cv2.CAP_ANY, [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+    if cap.get(cv2.CAP_PROP_HW_ACCELERATION) == cv2.VIDEO_ACCELERATION_NONE:
+        print("Camera: Hardware decode unavailable, using software decode")
+    return cap
+
+def capture_frames(cap, frames, stop):
+    """Read frames in the background, dropping the oldest when the display lags."""
+    while not stop.is_set():
         ret, frame = cap.read()
         if not ret:
             break
 
+        if frames.full():
+            try:
+                frames.get_nowait()
+            except queue.Empty:
+                pass
+        frames.put_nowait(frame)
+
+def start_camera():
+    """Capture video from the webcam and detect objects."""
+    cap = open_camera(0)
+
+    # Decode runs on its own thread so it overlaps with display
+    frames = queue.Queue(maxsize=2)
+    stop = threading.Event()
+    grabber = threading.Thread(target=capture_frames, args=(cap, frames, stop), daemon=True)
+    grabber.start()
+
+    while grabber.is_alive() or not frames.empty():
+        try:
+            frame = frames.get(timeout=0.05)
+        except queue.Empty:
+            continue
+
         # Display the video stream
         cv2.imshow('Camera Feed', frame)
 
         if cv2.waitKey(1) & 0xFF == ord('q'):
             break
 
+    stop.set()
+    grabber.join()
     cap.release()
     cv2.destroyAllWindows()
 
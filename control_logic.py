@@ -1,28 +1,38 @@
 # ai_brain.py
 import time
-import random
 from shared_memory import SharedMemoryBus
 
 class AIBrain:
     """AI decision-making module."""
-    def __init__(self, bus):
+    def __init__(self, bus, interval=1.0):
         self.bus = bus
+        self.interval = interval  # Seconds between decisions
+
+    @staticmethod
+    def decide(sensor_data):
+        """Map sensor readings to a motor command (0 = stop, 1 = forward, 2 = reverse)."""
+        # Simple decision logic (can be replaced with advanced AI models)
+        if sensor_data[0] > 0.5:
+            return 1  # Move forward
+        if sensor_data[1] > 0.5:
+            return 2  # Reverse
+        return 0  # Stop
 
     def run(self):
         """Continuously make decisions based on sensor data."""
+        next_deadline = time.monotonic()
         while True:
             sensor_data = self.bus.read_sensor_data()
             print(f"AI Brain: Sensor data: {sensor_data}")
 
-            # Simple decision logic (can be replaced with advanced AI models)
-            if sensor_data[0] > 0.5:
-                self.bus.write_motor_command(1)  # Move forward
-            elif sensor_data[1] > 0.5:
-                self.bus.write_motor_command(2)  # Reverse
-            else:
-                self.bus.write_motor_command(0)  # Stop
+            self.bus.write_motor_command(self.decide(sensor_data))
 
-            time.sleep(1)  # Simulate decision-making interval
+            # Sleep to a fixed schedule so decision time does not add drift
+            next_deadline += self.interval
+            now = time.monotonic()
+            if next_deadline < now:
+                next_deadline = now  # Overran or stalled: skip missed ticks rather than burst
+            time.sleep(next_deadline - now)
 
 if __name__ == "__main__":
     bus = SharedMemoryBus()
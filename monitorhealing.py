@@ -1,14 +1,16 @@
 # self_healing.py
-import time
 from shared_memory import SharedMemoryBus
 
 class SelfHealingSystem:
     """Monitors and repairs system issues autonomously."""
-    def __init__(self, bus):
+    def __init__(self, bus, timeout=2.0):
         self.bus = bus
+        self.timeout = timeout  # Longest wait between health checks
+        self.wakeup = bus.subscribe("motor", "sensor")
 
     def monitor(self):
         """Continuously monitor system health."""
+        sequence = self.bus.read_sequence()
         while True:
             sensor_data = self.bus.read_sensor_data()
             motor_command = self.bus.read_motor_command()
@@ -16,9 +18,11 @@ class SelfHealingSystem:
             # Detect potential issues (e.g., stuck motors or bad sensor readings)
             if motor_command == 1 and sensor_data[0] < 0.2:
                 print("⚠️ Issue detected: Motor moving but no progress.")
-                self.bus.write_motor_command(0)  # Stop the motor as a safeguard
+                motor_sequence = self.bus.write_motor_command(0)  # Stop the motor as a safeguard
+                sequence = (motor_sequence, sequence[1])  # Don't wake up for our own write
 
-            time.sleep(2)  # Monitor at regular intervals
+            # Re-check as soon as another subsystem writes to the bus
+            sequence = self.bus.wait_for_update(self.wakeup, sequence, timeout=self.timeout)
 
 if __name__ == "__main__":
     bus = SharedMemoryBus()
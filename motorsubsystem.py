@@ -1,14 +1,16 @@
 # motor_control.py
-import time
 from shared_memory import SharedMemoryBus
 
 class MotorControl:
     """Control motors based on commands from the shared memory bus."""
-    def __init__(self, bus):
+    def __init__(self, bus, timeout=0.5):
         self.bus = bus
+        self.timeout = timeout  # Longest wait before re-reporting the current command
+        self.wakeup = bus.subscribe("motor")
 
     def run(self):
         """Continuously read motor commands and act."""
+        sequence = self.bus.read_sequence("motor")
         while True:
             command = self.bus.read_motor_command()
             if command == 1:
@@ -17,7 +19,7 @@ class MotorControl:
                 print("Motor: Reversing")
             else:
                 print("Motor: Stopped")
-            time.sleep(0.5)  # Simulate hardware loop delay
+            sequence = self.bus.wait_for_update(self.wakeup, sequence, channel="motor", timeout=self.timeout)
 
 if __name__ == "__main__":
     bus = SharedMemoryBus()
@@ -1,21 +1,20 @@
 from Crypto.Cipher import AES
-from Crypto.Util.Padding import pad, unpad
 from Crypto.Random import get_random_bytes
 
 # Generate a random key for AES-256
 key = get_random_bytes(32)  # 32 bytes = 256 bits
-iv = get_random_bytes(16)  # Initialization vector
 
 def encrypt_data(data):
-    """Encrypt data using AES-256."""
-    cipher = AES.new(key, AES.MODE_CBC, iv)
-    encrypted = cipher.encrypt(pad(data.encode(), AES.block_size))
-    return encrypted
+    """Encrypt data using AES-256-GCM; returns nonce + tag + ciphertext."""
+    cipher = AES.new(key, AES.MODE_GCM, nonce=get_random_bytes(12))  # Fresh 96-bit nonce per message
+    encrypted, tag = cipher.encrypt_and_digest(data.encode())
+    return cipher.nonce + tag + encrypted
 
 def decrypt_data(encrypted_data):
-    """Decrypt AES-256 encrypted data."""
-    cipher = AES.new(key, AES.MODE_CBC, iv)
-    decrypted = unpad(cipher.decrypt(encrypted_data), AES.block_size)
+    """Decrypt and authenticate AES-256-GCM encrypted data."""
+    nonce, tag, encrypted = encrypted_data[:12], encrypted_data[12:28], encrypted_data[28:]
+    cipher = AES.new(key, AES.MODE_GCM, nonce=nonce)
+    decrypted = cipher.decrypt_and_verify(encrypted, tag)
     return decrypted.decode()
 
 # Test the encryption and decryption
@@ -1,20 +1,20 @@
 # encryption.py
 from Crypto.Cipher import AES
-from Crypto.Util.Padding import pad, unpad
 from Crypto.Random import get_random_bytes
 
 class EncryptionLayer:
-    """AES-256 encryption for secure communication."""
+    """AES-256-GCM encryption for secure communication."""
     def __init__(self):
         self.key = get_random_bytes(32)
-        self.iv = get_random_bytes(16)
 
     def encrypt(self, data):
-        """Encrypt data."""
-        cipher = AES.new(self.key, AES.MODE_CBC, self.iv)
-        return cipher.encrypt(pad(data.encode(), AES.block_size))
+        """Encrypt data; returns nonce + tag + ciphertext."""
+        cipher = AES.new(self.key, AES.MODE_GCM, nonce=get_random_bytes(12))
+        encrypted, tag = cipher.encrypt_and_digest(data.encode())
+        return cipher.nonce + tag + encrypted
 
     def decrypt(self, encrypted_data):
-        """Decrypt data."""
-        cipher = AES.new(self.key, AES.MODE_CBC, self.iv)
-        return unpad(cipher.decrypt(encrypted_data), AES.block_size).decode()
+        """Decrypt and authenticate data."""
+        nonce, tag, encrypted = encrypted_data[:12], encrypted_data[12:28], encrypted_data[28:]
+        cipher = AES.new(self.key, AES.MODE_GCM, nonce=nonce)
+        return cipher.decrypt_and_verify(encrypted, tag).decode()
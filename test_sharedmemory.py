@@ -1,25 +1,136 @@
 # shared_memory.py
+import contextlib
 import multiprocessing
+import platform
+import time
+
+SENSOR_COUNT = 3
+
+# The lock-free sensor seqlock relies on x86 keeping stores and loads in program order (TSO);
+# weaker memory models such as ARM take a lock around sensor reads and writes instead
+LOCK_FREE_SENSORS = platform.machine().lower() in ("x86_64", "amd64", "i386", "i686", "x86")
 
 class SharedMemoryBus:
     """Shared memory communication layer for AI and subsystems."""
-    def __init__(self):
-        self.motor_command = multiprocessing.Value('i', 0)  # 0 = stop, 1 = forward, 2 = reverse
-        self.sensor_data = multiprocessing.Array('d', [0.0] * 3)  # Placeholder for 3 sensor values
+    def __init__(self, context=None):
+        # The context must match the start method of the processes sharing the bus
+        self.context = context or multiprocessing.get_context()
+        context = self.context
+        # Bus values live in plain shared memory; reads never take a lock
+        self.motor_command = context.Value('i', 0, lock=False)  # 0 = stop, 1 = forward, 2 = reverse
+        self.sensor_data = context.Array('d', [0.0] * (2 * SENSOR_COUNT), lock=False)  # Two slots of sensor values
+        self.sensor_seq = context.Value('Q', 0, lock=False)  # Odd while a sensor write is in progress
+        self.sensor_guard = contextlib.nullcontext() if LOCK_FREE_SENSORS else context.Lock()
+        self.motor_updates = context.Value('Q', 0, lock=False)  # Bumped on every motor write
+        self.motor_lock = context.Lock()  # Pairs each motor command with its update number
+        self.sensor_updates = context.Value('Q', 0, lock=False)  # Bumped on every sensor write
+        self.subscribers = {"motor": [], "sensor": []}  # One wake-up token per subscriber and channel
 
     def read_motor_command(self):
         """Read the current motor command."""
         return self.motor_command.value
 
     def write_motor_command(self, command):
-        """Write a new motor command."""
-        self.motor_command.value = command
+        """Write a new motor command and return the motor update sequence it produced."""
+        # Several subsystems write commands, so store and count them together
+        with self.motor_lock:
+            self.motor_command.value = command
+            self.motor_updates.value += 1
+            sequence = self.motor_updates.value
+        self._notify("motor")
+        return sequence
 
     def update_sensor_data(self, data):
-        """Update sensor data."""
-        for i in range(len(data)):
-            self.sensor_data[i] = data[i]
+        """Update sensor data (from a single writer process)."""
+        if len(data) > SENSOR_COUNT:
+            raise ValueError(f"Expected at most {SENSOR_COUNT} sensor values, got {len(data)}")
+
+        with self.sensor_guard:
+            # Build the new vector before the counter goes odd so a failure cannot leave it mid-write
+            seq = self.sensor_seq.value
+            current = SENSOR_COUNT * (seq // 2 % 2)
+            start = SENSOR_COUNT - current  # Fill the slot readers are not using
+            values = list(data) + self.sensor_data[current + len(data):current + SENSOR_COUNT]
+
+            self.sensor_seq.value = seq + 1
+            self.sensor_data[start:start + SENSOR_COUNT] = values
+            self.sensor_seq.value = seq + 2
+        self.sensor_updates.value += 1
+        self._notify("sensor")
+
+    def _notify(self, channel):
+        # Releasing a semaphore never blocks, so a stopped or killed subscriber cannot stall writers
+        for token in self.subscribers[channel]:
+            try:
+                token.release()
+            except ValueError:
+                pass  # Already signalled and not yet consumed
+
+    def subscribe(self, *channels):
+        """Return a wake-up token for the given channels (all of them if none are given)."""
+        # Subscribe before starting the processes that write to the bus so they inherit the token
+        token = self.context.BoundedSemaphore(1)
+        token.acquire()  # Start unsignalled
+        for channel in channels or tuple(self.subscribers):
+            self.subscribers[channel].append(token)
+        return token
+
+    def read_sequence(self, channel=None):
+        """Read the "motor" or "sensor" update counter, or a (motor, sensor) pair when channel is None."""
+        if channel == "motor":
+            return self.motor_updates.value
+        if channel == "sensor":
+            return self.sensor_updates.value
+        return (self.motor_updates.value, self.sensor_updates.value)
+
+    def wait_for_update(self, token, last_sequence, channel=None, timeout=None):
+        """Block until read_sequence(channel) moves past last_sequence or timeout expires; return the value."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            sequence = self.read_sequence(channel)
+            if sequence != last_sequence:
+                return sequence
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return sequence
+            token.acquire(timeout=remaining)
 
     def read_sensor_data(self):
         """Read the current sensor data."""
-        return list(self.sensor_data)
+        with self.sensor_guard:
+            while True:
+                seq = self.sensor_seq.value
+                start = SENSOR_COUNT * (seq // 2 % 2)
+                values = self.sensor_data[start:start + SENSOR_COUNT]
+                # The slot is only overwritten once a second, newer write has started
+                if self.sensor_seq.value <= (seq & ~1) + 2:
+                    return values
+
+def write_sensor_ramp(bus, count):
+    """Write count updates, each storing the same value in every sensor."""
+    for i in range(count):
+        bus.update_sensor_data([float(i)] * SENSOR_COUNT)
+
+def count_torn_reads(start_method, count=100000):
+    """Read sensors while another process writes them; return (reads, torn), torn counting mixed vectors."""
+    context = multiprocessing.get_context(start_method)
+    bus = SharedMemoryBus(context)
+    writer = context.Process(target=write_sensor_ramp, args=(bus, count))
+    writer.start()
+
+    reads = torn = 0
+    while writer.is_alive():
+        values = bus.read_sensor_data()
+        reads += 1
+        if values.count(values[0]) != SENSOR_COUNT:
+            torn += 1
+    writer.join()
+    return reads, torn
+
+if __name__ == "__main__":
+    # Exercise the sensor seqlock across processes
+    print(f"Lock-free sensors: {LOCK_FREE_SENSORS} ({platform.machine()})")
+    for start_method in multiprocessing.get_all_start_methods():
+        reads, torn = count_torn_reads(start_method)
+        print(f"{start_method}: {reads} reads, {torn} torn")
+        assert torn == 0, "Sensor read returned a partially written vector"